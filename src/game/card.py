@@ -4,9 +4,20 @@ from typing import List
 import random
 
 
+_CARD_VALUES = tuple(range(1, 105))
+
+# Penalty points indexed by card value (index 0 is unused padding)
+_POINTS = tuple(
+    7 if v == 55 else 5 if v % 11 == 0 else 3 if v % 10 == 0 else 2 if v % 5 == 0 else 1
+    for v in range(105)
+)
+
+
 class Card:
     """Represents a single card with value and point calculation."""
     
+    __slots__ = ('_value',)
+    
     def __init__(self, value: int):
         """Initialize card with given value.
         
@@ -31,21 +42,12 @@ class Card:
     
     @property
     def points(self) -> int:
-        """Calculate penalty points for this card.
+        """Get penalty points for this card.
         
         Returns:
-            Penalty points (1-7) based on card value
+            Penalty points (1-7), looked up from the precomputed table
         """
-        if self._value == 55:
-            return 7
-        elif self._value % 11 == 0:
-            return 5
-        elif self._value % 10 == 0:
-            return 3
-        elif self._value % 5 == 0:
-            return 2
-        else:
-            return 1
+        return _POINTS[self._value]
     
     def __str__(self) -> str:
         """String representation of card.
@@ -72,9 +74,10 @@ class Card:
         Returns:
             True if other is a Card with same value
         """
-        if isinstance(other, Card):
+        try:
             return self._value == other._value
-        return False
+        except AttributeError:
+            return NotImplemented
     
     def __lt__(self, other) -> bool:
         """Compare cards by value.
@@ -85,9 +88,10 @@ class Card:
         Returns:
             True if this card's value is less than other's
         """
-        if isinstance(other, Card):
+        try:
             return self._value < other._value
-        return NotImplemented
+        except AttributeError:
+            return NotImplemented
     
     def __hash__(self) -> int:
         """Hash based on card value.
@@ -98,13 +102,20 @@ class Card:
         return hash(self._value)
 
 
+# Shared, immutable Card instances for every value (index = value - 1)
+_CARD_POOL = tuple(Card(v) for v in _CARD_VALUES)
+
+
 class Deck:
-    """Manages the deck of 104 cards."""
+    """Manages the deck of 104 cards.
+    
+    Cards are stored as plain integer values and only materialized as
+    pooled Card instances when dealt.
+    """
     
     def __init__(self):
         """Initialize deck with all 104 cards."""
-        self._cards = [Card(i) for i in range(1, 105)]
-        self.shuffle()
+        self._cards = random.sample(_CARD_VALUES, len(_CARD_VALUES))
     
     def shuffle(self) -> None:
         """Shuffle the deck randomly."""
@@ -121,7 +132,7 @@ class Deck:
         """
         if not self._cards:
             raise IndexError("Cannot deal from empty deck")
-        return self._cards.pop()
+        return _CARD_POOL[self._cards.pop() - 1]
     
     def deal_cards(self, count: int) -> List[Card]:
         """Deal multiple cards from the deck.
@@ -137,7 +148,10 @@ class Deck:
         """
         if count > len(self._cards):
             raise IndexError(f"Cannot deal {count} cards, only {len(self._cards)} remaining")
-        return [self.deal_card() for _ in range(count)]
+        split = len(self._cards) - count
+        dealt = [_CARD_POOL[value - 1] for value in reversed(self._cards[split:])]
+        del self._cards[split:]
+        return dealt
     
     @property
     def remaining_cards(self) -> int:
@@ -150,5 +164,4 @@ class Deck:
     
     def reset(self) -> None:
         """Reset deck with all 104 cards and shuffle."""
-        self._cards = [Card(i) for i in range(1, 105)]
-        self.shuffle()
+        self._cards = random.sample(_CARD_VALUES, len(_CARD_VALUES))
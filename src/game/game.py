@@ -1,15 +1,20 @@
 """Main game logic and round management for 5 Takes."""
 
-from typing import List, Tuple, Optional
-from .card import Card, Deck
+from typing import Dict, List, Tuple, Optional
+from operator import attrgetter
+from .card import Card, Deck, _POINTS
 from .player import Player
 from .table import Table
 from .rules import GameRules
 
+_CARD_VALUE = attrgetter('_value')
+
 
 class GameState:
     """Tracks current game state."""
     
+    __slots__ = ('round_number', 'turn_number', 'is_game_over', 'winner')
+    
     def __init__(self):
         """Initialize empty game state."""
         self.round_number = 0
@@ -34,19 +39,26 @@ class Game:
         GameRules.validate_player_names(player_names)
         
         self._players = [Player(name) for name in player_names]
+        self._players_view = tuple(self._players)
+        self._players_by_name: Dict[str, Player] = {p.name: p for p in self._players}
         self._deck = Deck()
         self._table: Optional[Table] = None
         self._state = GameState()
-        self._turn_results: List[Tuple[Player, Card, int, Optional[List[Card]]]] = []
+        # Reused across turns; only the first _turn_results_len slots are valid
+        self._turn_results: List[Optional[Tuple[Player, Card, int, Optional[List[Card]]]]] = (
+            [None] * len(self._players)
+        )
+        self._turn_results_len = 0
+        self._forced_row_choices: Dict[int, int] = {}
     
     @property
-    def players(self) -> List[Player]:
-        """Get list of all players.
+    def players(self) -> Tuple[Player, ...]:
+        """Get all players.
         
         Returns:
-            Copy of players list
+            Read-only tuple of players in seating order
         """
-        return self._players.copy()
+        return self._players_view
     
     @property
     def table(self) -> Optional[Table]:
@@ -73,13 +85,13 @@ class Game:
         Returns:
             List of (player, card, row_index, wiped_cards) tuples
         """
-        return self._turn_results.copy()
+        return self._turn_results[:self._turn_results_len]
     
     def start_new_round(self) -> None:
         """Start a new round of the game."""
         self._state.round_number += 1
         self._state.turn_number = 0
-        self._turn_results = []
+        self._turn_results_len = 0
         
         for player in self._players:
             player.reset_round_score()
@@ -88,7 +100,7 @@ class Game:
         self._deck.reset()
         
         starting_cards = self._deck.deal_cards(GameRules.STARTING_ROWS)
-        starting_cards.sort()
+        starting_cards.sort(key=_CARD_VALUE)
         self._table = Table(starting_cards)
         
         for player in self._players:
@@ -129,11 +141,11 @@ class Game:
             raise ValueError("Not all players have selected cards")
         
         self._state.turn_number += 1
-        self._turn_results = []
+        self._turn_results_len = 0
         
         sorted_players = GameRules.sort_players_by_card_value(self._players)
         
-        for player in sorted_players:
+        for i, player in enumerate(sorted_players):
             played_card = player.play_selected_card()
             
             if self._table.must_wipe_row(played_card):
@@ -143,12 +155,13 @@ class Game:
             
             penalty_points = 0
             if wiped_cards:
-                penalty_points = GameRules.calculate_penalty_points(wiped_cards)
+                penalty_points = sum(map(_POINTS.__getitem__, map(_CARD_VALUE, wiped_cards)))
                 player.add_penalty_points(penalty_points)
             
-            self._turn_results.append((player, played_card, row_index, wiped_cards))
+            self._turn_results[i] = (player, played_card, row_index, wiped_cards)
+            self._turn_results_len = i + 1
         
-        return self._turn_results.copy()
+        return self._turn_results[:self._turn_results_len]
     
     def _process_forced_wipe(self, player: Player, card: Card) -> Tuple[int, List[Card]]:
         """Handle when player must choose a row to wipe.
@@ -162,10 +175,8 @@ class Game:
         """
         row_choices = self._table.get_row_choices()
         
-        if hasattr(player, '_forced_row_choice'):
-            row_choice = getattr(player, '_forced_row_choice')
-            delattr(player, '_forced_row_choice')
-        else:
+        row_choice = self._forced_row_choices.pop(id(player), None)
+        if row_choice is None:
             row_choice = self._get_row_choice_for_player(player, row_choices)
         
         return self._table.place_card(card, forced_row=row_choice)
@@ -194,7 +205,7 @@ class Game:
         """
         if not 0 <= row_index < GameRules.STARTING_ROWS:
             raise ValueError(f"Row index must be 0-{GameRules.STARTING_ROWS-1}")
-        setattr(player, '_forced_row_choice', row_index)
+        self._forced_row_choices[id(player)] = row_index
     
     def is_round_over(self) -> bool:
         """Check if current round is finished.
@@ -233,10 +244,7 @@ class Game:
         Returns:
             Player with matching name or None
         """
-        for player in self._players:
-            if player.name == name:
-                return player
-        return None
+        return self._players_by_name.get(name)
     
     def clear_all_selections(self) -> None:
         """Clear all player card selections."""
@@ -249,23 +257,14 @@ class Game:
         Returns:
             List of (player, card) tuples for players who must wipe
         """
-        needing_choice = []
         sorted_players = GameRules.sort_players_by_card_value(self._players)
         
-        temp_table = Table([row.cards[0] for row in self._table.rows])
-        for row_idx, row in enumerate(self._table.rows):
-            for card in row.cards[1:]:
-                temp_table.get_row(row_idx)._cards.append(card)
-        
-        for player in sorted_players:
-            if player.has_selected_card:
-                if temp_table.must_wipe_row(player.selected_card):
-                    needing_choice.append((player, player.selected_card))
-                    # Player wipes a row, so update temp table for next check
-                    # For simplicity, we'll just use row 0 as placeholder
-                    temp_table.get_row(0)._cards = [player.selected_card]
-                else:
-                    # Place card normally on temp table
-                    temp_table.place_card(player.selected_card)
+        # Cards resolve in ascending order and each placed card becomes a row's
+        # last card, so every later card is higher than some row end. Only the
+        # lowest card this turn can be too low for all rows.
+        if sorted_players:
+            lowest = sorted_players[0]
+            if lowest.selected_card.value < self._table.min_last_value:
+                return [(lowest, lowest.selected_card)]
         
-        return needing_choice
+        return []
@@ -1,12 +1,19 @@
 """Player management for 5 Takes game."""
 
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
+import bisect
 from .card import Card
 
 
 class Player:
     """Represents a player in the game."""
     
+    __slots__ = (
+        '_name', '_hand', '_hand_set', '_hand_view',
+        '_total_score', '_round_score', '_selected_card',
+        '_hand_size', '_has_selected_card',
+    )
+    
     def __init__(self, name: str):
         """Initialize player with name.
         
@@ -20,9 +27,13 @@ class Player:
             raise ValueError("Player name cannot be empty")
         self._name = name.strip()
         self._hand: List[Card] = []
+        self._hand_set: Set[Card] = set()
+        self._hand_view: Optional[Tuple[Card, ...]] = None
         self._total_score = 0
         self._round_score = 0
         self._selected_card: Optional[Card] = None
+        self._hand_size = 0
+        self._has_selected_card = False
     
     @property
     def name(self) -> str:
@@ -34,13 +45,15 @@ class Player:
         return self._name
     
     @property
-    def hand(self) -> List[Card]:
+    def hand(self) -> Tuple[Card, ...]:
         """Get player's current hand.
         
         Returns:
-            Sorted list of cards in hand
+            Sorted tuple of cards in hand, rebuilt only when the hand changes
         """
-        return sorted(self._hand)
+        if self._hand_view is None:
+            self._hand_view = tuple(self._hand)
+        return self._hand_view
     
     @property
     def hand_size(self) -> int:
@@ -49,7 +62,7 @@ class Player:
         Returns:
             Current number of cards in hand
         """
-        return len(self._hand)
+        return self._hand_size
     
     @property
     def total_score(self) -> int:
@@ -85,7 +98,7 @@ class Player:
         Returns:
             True if card is selected for this turn
         """
-        return self._selected_card is not None
+        return self._has_selected_card
     
     def deal_cards(self, cards: List[Card]) -> None:
         """Add cards to player's hand.
@@ -93,8 +106,12 @@ class Player:
         Args:
             cards: Cards to add to hand
         """
+        # Timsort finds ascending runs, so a presorted deal merges in linear time
         self._hand.extend(cards)
         self._hand.sort()
+        self._hand_set.update(cards)
+        self._hand_view = None
+        self._hand_size = len(self._hand)
     
     def has_card(self, card: Card) -> bool:
         """Check if player has specific card in hand.
@@ -105,7 +122,7 @@ class Player:
         Returns:
             True if card is in hand
         """
-        return card in self._hand
+        return card in self._hand_set
     
     def select_card(self, card: Card) -> None:
         """Select a card from hand for current turn.
@@ -116,12 +133,13 @@ class Player:
         Raises:
             ValueError: If card not in hand or already selected
         """
-        if card not in self._hand:
+        if card not in self._hand_set:
             raise ValueError(f"Card {card.value} not in player's hand")
         if self._selected_card is not None:
             raise ValueError("Player has already selected a card this turn")
         
         self._selected_card = card
+        self._has_selected_card = True
     
     def play_selected_card(self) -> Card:
         """Remove and return the selected card.
@@ -136,8 +154,12 @@ class Player:
             raise ValueError("No card selected")
         
         played_card = self._selected_card
-        self._hand.remove(played_card)
+        del self._hand[bisect.bisect_left(self._hand, played_card)]
+        self._hand_set.discard(played_card)
+        self._hand_view = None
+        self._hand_size -= 1
         self._selected_card = None
+        self._has_selected_card = False
         return played_card
     
     def add_penalty_points(self, points: int) -> None:
@@ -161,6 +183,7 @@ class Player:
     def clear_selection(self) -> None:
         """Clear current card selection."""
         self._selected_card = None
+        self._has_selected_card = False
     
     def get_card_by_index(self, index: int) -> Card:
         """Get card from hand by index.
@@ -174,8 +197,8 @@ class Player:
         Raises:
             IndexError: If index is out of range
         """
-        if not 0 <= index < len(self._hand):
-            raise IndexError(f"Hand index must be 0-{len(self._hand)-1}")
+        if not 0 <= index < self._hand_size:
+            raise IndexError(f"Hand index must be 0-{self._hand_size-1}")
         return self._hand[index]
     
     def __str__(self) -> str:
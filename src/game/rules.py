@@ -1,9 +1,13 @@
 """Game rules and validation for 5 Takes."""
 
 from typing import List
-from .card import Card
+from operator import attrgetter
+from .card import Card, _POINTS
 from .player import Player
 
+_CARD_VALUE = attrgetter('_value')
+_SELECTED_VALUE = attrgetter('selected_card.value')
+
 
 class GameRules:
     """Encapsulates all game rules and validation."""
@@ -41,13 +45,15 @@ class GameRules:
         if not names:
             raise ValueError("No player names provided")
         
-        cleaned_names = [name.strip() for name in names]
-        
-        if any(not name for name in cleaned_names):
+        if any(not name.strip() for name in names):
             raise ValueError("Player names cannot be empty")
         
-        if len(set(cleaned_names)) != len(cleaned_names):
-            raise ValueError("Player names must be unique")
+        seen = set()
+        for name in names:
+            cleaned_name = name.strip()
+            if cleaned_name in seen:
+                raise ValueError("Player names must be unique")
+            seen.add(cleaned_name)
     
     @classmethod
     def calculate_cards_needed(cls, player_count: int) -> int:
@@ -124,7 +130,7 @@ class GameRules:
         Returns:
             Sum of penalty points for all cards
         """
-        return sum(card.points for card in cards)
+        return sum(map(_POINTS.__getitem__, map(_CARD_VALUE, cards)))
     
     @classmethod
     def sort_players_by_card_value(cls, players: List[Player]) -> List[Player]:
@@ -136,10 +142,7 @@ class GameRules:
         Returns:
             Players sorted by card value (ascending)
         """
-        return sorted(
-            [p for p in players if p.has_selected_card],
-            key=lambda p: p.selected_card.value
-        )
+        return sorted((p for p in players if p.has_selected_card), key=_SELECTED_VALUE)
     
     @classmethod
     def validate_card_selection(cls, player: Player, card: Card) -> None:
@@ -1,11 +1,28 @@
 """Game table and row management for 5 Takes."""
 
-from typing import List, Optional
-from .card import Card
+from array import array
+from typing import Iterable, Iterator, List, Optional
+from .card import Card, _CARD_POOL
+
+
+def _to_cards(values: Iterable[int]) -> List[Card]:
+    """Map card values to their shared Card instances.
+    
+    Args:
+        values: Card values (1-104)
+        
+    Returns:
+        List of pooled Card objects in the same order
+    """
+    return [_CARD_POOL[value - 1] for value in values]
 
 
 class Row:
-    """Represents a single row of cards on the table."""
+    """Represents a single row of cards on the table.
+    
+    Card values are stored in a compact integer array; Card objects are only
+    produced for callers that ask for them.
+    """
     
     MAX_CARDS = 5
     
@@ -15,7 +32,10 @@ class Row:
         Args:
             starting_card: The first card in the row
         """
-        self._cards = [starting_card]
+        self._values = array('h', (starting_card.value,))
+        self._points_sum = starting_card.points
+        self._last_value = starting_card.value
+        self._count = 1
     
     @property
     def cards(self) -> List[Card]:
@@ -24,7 +44,7 @@ class Row:
         Returns:
             Copy of cards list in this row
         """
-        return self._cards.copy()
+        return _to_cards(self._values)
     
     @property
     def last_card(self) -> Card:
@@ -33,7 +53,7 @@ class Row:
         Returns:
             The last card placed in this row
         """
-        return self._cards[-1]
+        return _CARD_POOL[self._last_value - 1]
     
     @property
     def is_full(self) -> bool:
@@ -42,7 +62,7 @@ class Row:
         Returns:
             True if row has 5 or more cards
         """
-        return len(self._cards) >= self.MAX_CARDS
+        return self._count >= self.MAX_CARDS
     
     @property
     def card_count(self) -> int:
@@ -51,7 +71,7 @@ class Row:
         Returns:
             Current number of cards in this row
         """
-        return len(self._cards)
+        return self._count
     
     @property
     def total_points(self) -> int:
@@ -60,7 +80,7 @@ class Row:
         Returns:
             Sum of penalty points for all cards
         """
-        return sum(card.points for card in self._cards)
+        return self._points_sum
     
     def can_place_card(self, card: Card) -> bool:
         """Check if card can be placed in this row.
@@ -71,7 +91,7 @@ class Row:
         Returns:
             True if card can be legally placed
         """
-        return card.value > self.last_card.value and not self.is_full
+        return card.value > self._last_value and self._count < self.MAX_CARDS
     
     def place_card(self, card: Card) -> Optional[List[Card]]:
         """Place card in row. Returns wiped cards if row becomes full.
@@ -85,17 +105,22 @@ class Row:
         Raises:
             ValueError: If card cannot be placed in row
         """
-        if not card.value > self.last_card.value:
-            raise ValueError(f"Card {card.value} cannot be placed after {self.last_card.value}")
+        if not card.value > self._last_value:
+            raise ValueError(f"Card {card.value} cannot be placed after {self._last_value}")
         
         if self.is_full:
             raise ValueError("Cannot place card in full row")
         
-        self._cards.append(card)
+        self._values.append(card.value)
+        self._points_sum += card.points
+        self._last_value = card.value
+        self._count += 1
         
         if self.is_full:
-            wiped_cards = self._cards[:-1]  # All cards except the last one
-            self._cards = [card]  # Keep only the card that was just placed
+            wiped_cards = _to_cards(self._values[:-1])  # All cards except the last one
+            self._values = array('h', (card.value,))  # Keep only the card just placed
+            self._points_sum = card.points
+            self._count = 1
             return wiped_cards
         
         return None
@@ -109,8 +134,11 @@ class Row:
         Returns:
             List of all cards that were wiped
         """
-        wiped_cards = self._cards.copy()
-        self._cards = [new_card]
+        wiped_cards = _to_cards(self._values)
+        self._values = array('h', (new_card.value,))
+        self._points_sum = new_card.points
+        self._last_value = new_card.value
+        self._count = 1
         return wiped_cards
     
     def __str__(self) -> str:
@@ -119,7 +147,23 @@ class Row:
         Returns:
             Space-separated string of cards in row
         """
-        return " ".join(str(card) for card in self._cards)
+        return " ".join(str(card) for card in self)
+    
+    def __iter__(self) -> Iterator[Card]:
+        """Iterate over cards in the row without copying.
+        
+        Returns:
+            Iterator over cards from first to last
+        """
+        return (_CARD_POOL[value - 1] for value in self._values)
+    
+    def __len__(self) -> int:
+        """Get number of cards in row.
+        
+        Returns:
+            Current number of cards in this row
+        """
+        return self._count
 
 
 class Table:
@@ -150,6 +194,33 @@ class Table:
         """
         return self._rows.copy()
     
+    def __iter__(self) -> Iterator[Row]:
+        """Iterate over rows without copying.
+        
+        Returns:
+            Iterator over the 4 rows in order
+        """
+        return iter(self._rows)
+    
+    def __getitem__(self, index: int) -> Row:
+        """Get row by index without bounds normalization.
+        
+        Args:
+            index: Row index
+            
+        Returns:
+            The requested row
+        """
+        return self._rows[index]
+    
+    def __len__(self) -> int:
+        """Get number of rows.
+        
+        Returns:
+            Number of rows on the table
+        """
+        return len(self._rows)
+    
     def get_row(self, index: int) -> Row:
         """Get specific row by index.
         
@@ -176,11 +247,14 @@ class Table:
             Row index (0-3) or None if no valid placement
         """
         best_row = None
-        smallest_gap = float('inf')
+        smallest_gap = 1 << 30
+        value = card.value
+        max_cards = Row.MAX_CARDS
         
         for i, row in enumerate(self._rows):
-            if row.can_place_card(card):
-                gap = card.value - row.last_card.value
+            last_value = row._last_value
+            if value > last_value and row._count < max_cards:
+                gap = value - last_value
                 if gap < smallest_gap:
                     smallest_gap = gap
                     best_row = i
@@ -214,6 +288,17 @@ class Table:
         wiped_cards = self._rows[target_row].place_card(card)
         return target_row, wiped_cards
     
+    @property
+    def min_last_value(self) -> int:
+        """Get the lowest rightmost card value across all rows.
+        
+        A card below this value must wipe a row.
+        
+        Returns:
+            Smallest last-card value on the table
+        """
+        return min(row._last_value for row in self._rows)
+    
     def must_wipe_row(self, card: Card) -> bool:
         """Check if card forces player to wipe a row.
         
@@ -223,7 +308,9 @@ class Table:
         Returns:
             True if card is too low for all rows
         """
-        return self.find_target_row(card) is None
+        value = card.value
+        max_cards = Row.MAX_CARDS
+        return not any(value > row._last_value and row._count < max_cards for row in self._rows)
     
     def get_row_choices(self) -> List[int]:
         """Get list of available row indices for wiping.
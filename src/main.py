@@ -3,6 +3,7 @@
 from typing import List, Optional
 from game.game import Game
 from game.player import Player
+from game.rules import GameRules
 from ui.input import InputHandler
 from ui.display import GameDisplay
 from ui.colors import colors
@@ -74,6 +75,8 @@ class GameController:
     
     def _collect_card_selections(self) -> None:
         """Collect card selections from all players with privacy handling."""
+        table_text = GameDisplay.render_table(self._game.table)
+        
         for player in self._game.players:
             GameDisplay.show_pass_device_prompt(player.name)
             
@@ -81,7 +84,8 @@ class GameController:
                 player, 
                 self._game.table,
                 self._game.state.round_number,
-                self._game.state.turn_number + 1
+                self._game.state.turn_number + 1,
+                table_text
             )
             
             self._game.select_card_for_player(player, selected_card)
@@ -96,16 +100,23 @@ class GameController:
         Processes players whose cards are too low for any row.
         """
         players_needing_choice = self._game.get_players_needing_row_choice()
+        if not players_needing_choice:
+            return
+        
+        # Get all selections for display, already in play order
+        all_selections = tuple(
+            (p.name, p.selected_card)
+            for p in GameRules.sort_players_by_card_value(self._game.players)
+        )
         
-        # Get all selections for display
-        all_selections = [(p.name, p.selected_card) 
-                         for p in self._game.players 
-                         if p.has_selected_card]
+        choices_text = InputHandler.render_row_choice_screen(self._game.table)
         
         for player, card in players_needing_choice:
             GameDisplay.show_pass_device_prompt(player.name)
             
-            row_choice = InputHandler.get_row_choice(player, self._game.table, all_selections)
+            row_choice = InputHandler.get_row_choice(
+                player, self._game.table, all_selections, choices_text
+            )
             self._game.set_forced_row_choice(player, row_choice)
             
             colors.clear_screen()
@@ -1,6 +1,8 @@
 """Terminal color schemes for 5 Takes game."""
 
 import os
+import sys
+from functools import lru_cache
 from colorama import Fore, Back, Style, init
 
 
@@ -31,6 +33,11 @@ class Colors:
     
     RESET = Style.RESET_ALL
     
+    CLEAR_SCREEN = "\x1b[2J\x1b[H"
+    
+    SEPARATOR_WIDTH = 60
+    SEPARATOR = "=" * SEPARATOR_WIDTH
+    
     @classmethod
     def card_color(cls, points: int) -> str:
         """Get color code for card based on point value.
@@ -43,8 +50,6 @@ class Colors:
         """
         if points >= 5:
             return cls.CARD_HIGH_POINTS
-        elif points >= 3:
-            return cls.CARD_MEDIUM_POINTS
         elif points >= 2:
             return cls.CARD_MEDIUM_POINTS
         else:
@@ -61,8 +66,7 @@ class Colors:
         Returns:
             Colored card string like '[  42]'
         """
-        color = cls.card_color(points)
-        return f"{color}[{value:3d}]{cls.RESET}"
+        return _colored_card(value, points)
     
     @classmethod
     def colored_text(cls, text: str, color: str) -> str:
@@ -77,20 +81,45 @@ class Colors:
         """
         return f"{color}{text}{cls.RESET}"
     
-    @staticmethod
-    def clear_screen() -> None:
-        """Clear terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+    @classmethod
+    def clear_screen_text(cls) -> str:
+        """Get the text that clears the screen when written.
+        
+        Terminals that cannot interpret escape codes are cleared immediately
+        by shelling out, and get an empty string back.
+        
+        Returns:
+            ANSI clear sequence, or empty string if already cleared
+        """
+        if os.environ.get('TERM') == 'dumb':
+            os.system('cls' if os.name == 'nt' else 'clear')
+            return ""
+        return cls.CLEAR_SCREEN
     
-    @staticmethod
-    def print_separator(width: int = 60, char: str = "=") -> None:
+    @classmethod
+    def clear_screen(cls) -> None:
+        """Clear terminal screen.
+        
+        Writes an ANSI clear sequence (translated by colorama on Windows) and
+        only shells out for terminals that cannot interpret escape codes.
+        """
+        text = cls.clear_screen_text()
+        if text:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+    
+    @classmethod
+    def print_separator(cls, width: int = 60, char: str = "=") -> None:
         """Print a separator line.
         
         Args:
             width: Width of separator line
             char: Character to use for separator
         """
-        print(char * width)
+        if width == cls.SEPARATOR_WIDTH and char == "=":
+            print(cls.SEPARATOR)
+        else:
+            print(char * width)
     
     @staticmethod
     def print_centered(text: str, width: int = 60) -> None:
@@ -100,7 +129,35 @@ class Colors:
             text: Text to center
             width: Total width for centering
         """
-        print(text.center(width))
+        print(_centered(text, width))
+
+
+@lru_cache(maxsize=64)
+def _centered(text: str, width: int = 60) -> str:
+    """Center text within a width, memoising repeated headers.
+    
+    Args:
+        text: Text to center
+        width: Total width for centering
+        
+    Returns:
+        Centered text
+    """
+    return text.center(width)
+
+
+@lru_cache(maxsize=128)
+def _colored_card(value: int, points: int) -> str:
+    """Build and memoise the colored string for a card.
+    
+    Args:
+        value: Card value (1-104)
+        points: Card penalty points
+        
+    Returns:
+        Colored card string like '[  42]'
+    """
+    return f"{Colors.card_color(points)}[{value:3d}]{Colors.RESET}"
 
 
 colors = Colors()
@@ -1,76 +1,121 @@
 """Terminal display formatting for 5 Takes game."""
 
 from typing import List, Optional, Tuple
+from operator import attrgetter
 import sys
-import os
-
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from game.player import Player
 from game.table import Table
 from game.card import Card
+from game.rules import GameRules
 from .colors import colors
 
+_MESSAGE_COLORS = {
+    "info": colors.INFO,
+    "success": colors.SUCCESS,
+    "warning": colors.WARNING,
+    "error": colors.ERROR
+}
+
 
 class GameDisplay:
-    """Handles all game display formatting."""
+    """Handles all game display formatting.
+    
+    Multi-line screens are assembled into one string and written with a single
+    stdout write to keep syscalls down and avoid partial redraws.
+    """
+    
+    SEPARATOR = colors.SEPARATOR
+    TITLE_BANNER = "\n".join([
+        SEPARATOR,
+        colors.colored_text("5 TAKES", colors.HEADER).center(60),
+        SEPARATOR,
+    ]) + "\n\n"
+    GAME_OVER_BANNER = "\n".join([
+        SEPARATOR,
+        colors.colored_text("GAME OVER", colors.HEADER).center(60),
+        SEPARATOR,
+    ]) + "\n\n"
     
     @staticmethod
     def show_title() -> None:
         """Display game title."""
         colors.clear_screen()
-        colors.print_separator()
-        colors.print_centered(colors.colored_text("5 TAKES", colors.HEADER))
-        colors.print_separator()
-        print()
+        sys.stdout.write(GameDisplay.TITLE_BANNER)
     
     @staticmethod
-    def show_round_header(round_num: int, turn_num: int = 0) -> None:
-        """Display round and turn information.
+    def render_round_header(round_num: int, turn_num: int = 0) -> str:
+        """Render round and turn information to a string.
         
         Args:
             round_num: Current round number
             turn_num: Current turn number (0 for no turn info)
+            
+        Returns:
+            Centered header and separator, ending with a blank line
         """
         if turn_num > 0:
             header = f"Round {round_num} - Turn {turn_num}"
         else:
             header = f"Round {round_num}"
-        colors.print_centered(colors.colored_text(header, colors.INFO))
-        colors.print_separator()
-        print()
+        centered = colors.colored_text(header, colors.INFO).center(60)
+        return f"{centered}\n{GameDisplay.SEPARATOR}\n\n"
     
     @staticmethod
-    def show_table(table: Table) -> None:
-        """Display current table state.
+    def show_round_header(round_num: int, turn_num: int = 0) -> None:
+        """Display round and turn information.
         
         Args:
-            table: Table to display
+            round_num: Current round number
+            turn_num: Current turn number (0 for no turn info)
+        """
+        sys.stdout.write(GameDisplay.render_round_header(round_num, turn_num))
+    
+    @staticmethod
+    def render_table(table: Table) -> str:
+        """Render current table state to a string.
+        
+        Args:
+            table: Table to render
+            
+        Returns:
+            Colored multi-line table text, ending with a newline
         """
-        print(colors.colored_text("Table:", colors.HEADER))
-        for i, row in enumerate(table.rows):
+        lines = [colors.colored_text("Table:", colors.HEADER)]
+        for i, row in enumerate(table):
             row_text = f"Row {i+1}: "
             card_texts = []
-            for card in row.cards:
+            for card in row:
                 card_texts.append(colors.colored_card(card.value, card.points))
-            print(f"{colors.colored_text(row_text, colors.TABLE_ROW)}{' '.join(card_texts)}")
-        print()
+            lines.append(f"{colors.colored_text(row_text, colors.TABLE_ROW)}{' '.join(card_texts)}")
+        return "\n".join(lines) + "\n"
     
     @staticmethod
-    def show_player_hand(player: Player, show_indices: bool = True) -> None:
-        """Display player's hand with optional indices.
+    def show_table(table: Table) -> None:
+        """Display current table state.
+        
+        Args:
+            table: Table to display
+        """
+        print(GameDisplay.render_table(table))
+    
+    @staticmethod
+    def render_player_hand(player: Player, show_indices: bool = True) -> str:
+        """Render player's hand with optional indices to a string.
         
         Args:
             player: Player whose hand to show
             show_indices: Whether to show card selection numbers
+            
+        Returns:
+            Colored multi-line hand text, ending with a newline
         """
-        print(colors.colored_text(f"{player.name}'s Hand:", colors.PLAYER_NAME))
+        lines = [colors.colored_text(f"{player.name}'s Hand:", colors.PLAYER_NAME)]
         
         hand = player.hand
         if not hand:
-            print("No cards in hand")
-            return
+            lines.append("No cards in hand")
+            return "\n".join(lines) + "\n"
         
         cards_per_line = 5
         for i in range(0, len(hand), cards_per_line):
@@ -78,20 +123,30 @@ class GameDisplay:
             
             if show_indices:
                 indices = [f"{j+1:2d}." for j in range(i, i + len(line_cards))]
-                print("  " + "     ".join(indices))
+                lines.append("  " + "     ".join(indices))
             
             card_displays = []
             for card in line_cards:
                 card_displays.append(colors.colored_card(card.value, card.points))
-            print("  " + "  ".join(card_displays))
+            lines.append("  " + "  ".join(card_displays))
             
             if show_indices:
                 points = [f"({card.points} pt{'s' if card.points != 1 else ''})" for card in line_cards]
-                print("  " + "  ".join(f"{p:>6s}" for p in points))
+                lines.append("  " + "  ".join(f"{p:>6s}" for p in points))
             
             if i + cards_per_line < len(hand):
-                print()
-        print()
+                lines.append("")
+        return "\n".join(lines) + "\n\n"
+    
+    @staticmethod
+    def show_player_hand(player: Player, show_indices: bool = True) -> None:
+        """Display player's hand with optional indices.
+        
+        Args:
+            player: Player whose hand to show
+            show_indices: Whether to show card selection numbers
+        """
+        sys.stdout.write(GameDisplay.render_player_hand(player, show_indices))
     
     @staticmethod
     def show_scores(players: List[Player], show_round_scores: bool = False) -> None:
@@ -101,7 +156,7 @@ class GameDisplay:
             players: List of players to show scores for
             show_round_scores: Whether to show current round scores
         """
-        print(colors.colored_text("Scores:", colors.HEADER))
+        lines = [colors.colored_text("Scores:", colors.HEADER)]
         
         for player in players:
             name_part = colors.colored_text(f"{player.name:15s}", colors.PLAYER_NAME)
@@ -114,8 +169,8 @@ class GameDisplay:
             else:
                 score_part = colors.colored_text(f"Total: {player.total_score:2d}", colors.SCORE)
             
-            print(f"  {name_part} {score_part}")
-        print()
+            lines.append(f"  {name_part} {score_part}")
+        sys.stdout.write("\n".join(lines) + "\n\n")
     
     @staticmethod
     def show_turn_results(results: List[Tuple[Player, Card, int, Optional[List[Card]]]]) -> None:
@@ -124,21 +179,21 @@ class GameDisplay:
         Args:
             results: List of (player, card, row_index, wiped_cards) tuples
         """
-        print(colors.colored_text("Turn Results:", colors.HEADER))
+        lines = [colors.colored_text("Turn Results:", colors.HEADER)]
         
         for player, card, row_index, wiped_cards in results:
             card_text = colors.colored_card(card.value, card.points)
             row_text = f"Row {row_index + 1}"
             
             if wiped_cards:
-                penalty_points = sum(c.points for c in wiped_cards)
+                penalty_points = GameRules.calculate_penalty_points(wiped_cards)
                 penalty_text = colors.colored_text(f"(+{penalty_points} points)", colors.ERROR)
-                print(f"  {colors.colored_text(player.name, colors.PLAYER_NAME)}: "
-                      f"{card_text} → {row_text} {penalty_text}")
+                lines.append(f"  {colors.colored_text(player.name, colors.PLAYER_NAME)}: "
+                             f"{card_text} → {row_text} {penalty_text}")
             else:
-                print(f"  {colors.colored_text(player.name, colors.PLAYER_NAME)}: "
-                      f"{card_text} → {row_text}")
-        print()
+                lines.append(f"  {colors.colored_text(player.name, colors.PLAYER_NAME)}: "
+                             f"{card_text} → {row_text}")
+        sys.stdout.write("\n".join(lines) + "\n\n")
     
     @staticmethod
     def show_card_selections(players: List[Player]) -> None:
@@ -149,29 +204,44 @@ class GameDisplay:
         """
         print(colors.colored_text("Selected Cards:", colors.HEADER))
         
-        selected_players = [(p, p.selected_card) for p in players if p.has_selected_card]
-        selected_players.sort(key=lambda x: x[1].value)
+        selected_players = sorted(
+            (p for p in players if p.has_selected_card),
+            key=attrgetter('selected_card.value')
+        )
         
-        for player, card in selected_players:
+        for player in selected_players:
+            card = player.selected_card
             card_text = colors.colored_card(card.value, card.points)
             print(f"  {colors.colored_text(player.name, colors.PLAYER_NAME)}: {card_text}")
         print()
     
     @staticmethod
-    def show_row_choices(table: Table) -> None:
-        """Display rows for selection when wiping.
+    def render_row_choices(table: Table) -> str:
+        """Render rows for selection when wiping to a string.
         
         Args:
             table: Table with rows to choose from
+            
+        Returns:
+            Colored multi-line row choice text, ending with a newline
         """
-        print(colors.colored_text("Choose a row to take:", colors.WARNING))
+        lines = [colors.colored_text("Choose a row to take:", colors.WARNING)]
         
-        for i, row in enumerate(table.rows):
+        for i, row in enumerate(table):
             points = row.total_points
-            cards_text = " ".join(colors.colored_card(card.value, card.points) for card in row.cards)
+            cards_text = " ".join(colors.colored_card(card.value, card.points) for card in row)
             point_text = colors.colored_text(f"({points} point{'s' if points != 1 else ''})", colors.ERROR)
-            print(f"  {i+1}. {cards_text} {point_text}")
-        print()
+            lines.append(f"  {i+1}. {cards_text} {point_text}")
+        return "\n".join(lines) + "\n"
+    
+    @staticmethod
+    def show_row_choices(table: Table) -> None:
+        """Display rows for selection when wiping.
+        
+        Args:
+            table: Table with rows to choose from
+        """
+        print(GameDisplay.render_row_choices(table))
     
     @staticmethod
     def show_game_over(winner: Player, final_scores: List[Tuple[str, int, int]]) -> None:
@@ -182,22 +252,20 @@ class GameDisplay:
             final_scores: List of (name, round_score, total_score) tuples
         """
         colors.clear_screen()
-        colors.print_separator()
-        colors.print_centered(colors.colored_text("GAME OVER", colors.HEADER))
-        colors.print_separator()
-        print()
-        
-        print(colors.colored_text(f"🎉 {winner.name} wins with {winner.total_score} points! 🎉", colors.SUCCESS))
-        print()
-        
-        print(colors.colored_text("Final Scores:", colors.HEADER))
+        lines = [
+            GameDisplay.GAME_OVER_BANNER
+            + colors.colored_text(f"🎉 {winner.name} wins with {winner.total_score} points! 🎉", colors.SUCCESS),
+            "",
+            colors.colored_text("Final Scores:", colors.HEADER),
+        ]
         sorted_scores = sorted(final_scores, key=lambda x: x[2])
         
         for i, (name, round_score, total_score) in enumerate(sorted_scores):
             position = f"{i+1}."
             name_part = colors.colored_text(f"{name:15s}", colors.PLAYER_NAME)
             score_part = colors.colored_text(f"{total_score:2d} points", colors.SCORE)
-            print(f"  {position:3s} {name_part} {score_part}")
+            lines.append(f"  {position:3s} {name_part} {score_part}")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     @staticmethod
     def prompt_for_input(message: str) -> str:
@@ -219,13 +287,7 @@ class GameDisplay:
             message: Message to display
             message_type: Type of message (info, success, warning, error)
         """
-        color_map = {
-            "info": colors.INFO,
-            "success": colors.SUCCESS,
-            "warning": colors.WARNING,
-            "error": colors.ERROR
-        }
-        color = color_map.get(message_type, colors.INFO)
+        color = _MESSAGE_COLORS.get(message_type, colors.INFO)
         print(colors.colored_text(message, color))
         print()
     
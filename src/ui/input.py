@@ -1,11 +1,9 @@
 """User input handling for 5 Takes game."""
 
-from typing import List, Optional, Tuple
+from contextlib import contextmanager, redirect_stdout
+from typing import Iterator, List, Optional, Sequence, Tuple
+import io
 import sys
-import os
-
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from game.player import Player
 from game.card import Card
@@ -13,6 +11,66 @@ from game.table import Table
 from .display import GameDisplay
 from .colors import colors
 
+_STDIN_READLINE = sys.stdin.readline
+
+_YES = frozenset(('y', 'Y'))
+_NO = frozenset(('n', 'N'))
+
+
+def _prompt(message: str) -> str:
+    """Display a colored prompt and read one line without input() overhead.
+    
+    Args:
+        message: Prompt message to display
+        
+    Returns:
+        User's input line without the trailing newline
+        
+    Raises:
+        EOFError: If input stream is closed
+    """
+    if message:
+        sys.stdout.write(colors.colored_text(message, colors.PROMPT))
+        sys.stdout.flush()
+    line = _STDIN_READLINE()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith('\n') else line
+
+
+def _parse_int(text: str, low: int, high: int) -> Optional[int]:
+    """Parse a whole number within bounds without raising.
+    
+    Args:
+        text: Raw user input
+        low: Smallest accepted value
+        high: Largest accepted value
+        
+    Returns:
+        Parsed value, or None if input is not a number between low and high
+    """
+    text = text.strip()
+    if not text.isdecimal():
+        return None
+    value = int(text)
+    return value if low <= value <= high else None
+
+
+@contextmanager
+def _buffered_stdout() -> Iterator[None]:
+    """Collect everything printed in the block and write it out in one go.
+    
+    Output is buffered in memory and handed to the real (colorama-wrapped)
+    stdout as a single write, so a whole screen costs one flush.
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
 
 class InputHandler:
     """Handles all user input with validation."""
@@ -27,46 +85,45 @@ class InputHandler:
         GameDisplay.show_title()
         
         while True:
-            try:
-                count_input = GameDisplay.prompt_for_input(
-                    "Enter number of players (3-10, or 'q' to quit): "
-                )
-                
-                if count_input.strip().lower() == 'q':
-                    raise KeyboardInterrupt("User quit game")
-                
-                player_count = int(count_input.strip())
-                
-                if not 3 <= player_count <= 10:
-                    GameDisplay.show_message("Number of players must be between 3 and 10", "error")
-                    continue
-                    
-                break
-                
-            except ValueError:
-                GameDisplay.show_message("Please enter a valid number", "error")
+            count_input = _prompt(
+                "Enter number of players (3-10, or 'q' to quit): "
+            )
+            
+            if count_input.strip().lower() == 'q':
+                raise KeyboardInterrupt("User quit game")
+            
+            player_count = _parse_int(count_input, 3, 10)
+            
+            if player_count is None:
+                GameDisplay.show_message("Number of players must be between 3 and 10", "error")
+                continue
+            
+            break
         
         print()
         names = []
+        seen = set()
         for i in range(player_count):
             while True:
-                name = GameDisplay.prompt_for_input(f"Enter name for Player {i+1}: ").strip()
+                name = _prompt(f"Enter name for Player {i+1}: ").strip()
                 
                 if not name:
                     GameDisplay.show_message("Name cannot be empty", "error")
                     continue
                 
-                if name in names:
+                if name in seen:
                     GameDisplay.show_message("Name already taken", "error")
                     continue
                 
+                seen.add(name)
                 names.append(name)
                 break
         
         return names
     
     @staticmethod
-    def get_card_selection(player: Player, table: Table, round_num: int = 1, turn_num: int = 1) -> Card:
+    def get_card_selection(player: Player, table: Table, round_num: int = 1, turn_num: int = 1,
+                           table_text: Optional[str] = None) -> Card:
         """Get card selection from player.
         
         Args:
@@ -74,64 +131,73 @@ class InputHandler:
             table: Current table state for display
             round_num: Current round number
             turn_num: Current turn number
+            table_text: Pre-rendered table from GameDisplay.render_table, reused
+                across players since the table does not change during selection
             
         Returns:
             Selected card from player's hand
         """
-        colors.clear_screen()
-        GameDisplay.show_round_header(round_num, turn_num)
-        GameDisplay.show_table(table)
+        hand_size = player.hand_size
+        
+        # Assemble the whole frame and hand it to stdout in one write
+        frame = [
+            colors.clear_screen_text(),
+            GameDisplay.render_round_header(round_num, turn_num),
+            table_text if table_text is not None else GameDisplay.render_table(table),
+            "\n",
+            GameDisplay.render_player_hand(player, show_indices=hand_size != 1),
+        ]
         
         # Auto-select if only one card left
-        if player.hand_size == 1:
+        if hand_size == 1:
             card = player.hand[0]
-            GameDisplay.show_player_hand(player, show_indices=False)
-            GameDisplay.show_message(f"Auto-selecting your last card: [{card.value}]", "info")
+            frame.append(colors.colored_text(f"Auto-selecting your last card: [{card.value}]", colors.INFO))
+            frame.append("\n\n")
+            sys.stdout.write("".join(frame))
             GameDisplay.wait_for_enter("Press Enter to continue...")
             return card
         
-        GameDisplay.show_player_hand(player, show_indices=True)
+        sys.stdout.write("".join(frame))
+        sys.stdout.flush()
         
         while True:
-            try:
-                selection = GameDisplay.prompt_for_input(
-                    f"Select a card (1-{player.hand_size}, or 'q' to quit): "
+            selection = _prompt(
+                f"Select a card (1-{hand_size}, or 'q' to quit): "
+            )
+            
+            if selection.strip().lower() == 'q':
+                raise KeyboardInterrupt("User quit game")
+            
+            number = _parse_int(selection, 1, hand_size)
+            
+            if number is None:
+                GameDisplay.show_message(
+                    f"Please enter a number between 1 and {hand_size}", 
+                    "error"
                 )
-                
-                if selection.strip().lower() == 'q':
-                    raise KeyboardInterrupt("User quit game")
-                
-                index = int(selection.strip()) - 1
-                
-                if not 0 <= index < player.hand_size:
-                    GameDisplay.show_message(
-                        f"Please enter a number between 1 and {player.hand_size}", 
-                        "error"
-                    )
-                    continue
-                
-                selected_card = player.get_card_by_index(index)
-                
-                confirm = GameDisplay.prompt_for_input(
-                    f"Play {colors.colored_card(selected_card.value, selected_card.points)}? (y/n): "
-                ).strip().lower()
-                
-                if confirm in ['y', 'yes']:
-                    return selected_card
-                
-            except ValueError:
-                GameDisplay.show_message("Please enter a valid number", "error")
-            except (IndexError, KeyError):
-                GameDisplay.show_message("Invalid selection", "error")
+                continue
+            
+            selected_card = player.get_card_by_index(number - 1)
+            
+            confirm = _prompt(
+                f"Play {colors.colored_card(selected_card.value, selected_card.points)}? (y/n): "
+            ).lstrip()[:1]
+            
+            if confirm in _YES:
+                return selected_card
     
     @staticmethod
-    def get_row_choice(player: Player, table: Table, all_selections: List[Tuple[str, Card]]) -> int:
+    def get_row_choice(player: Player, table: Table, all_selections: Sequence[Tuple[str, Card]],
+                       choices_text: Optional[str] = None) -> int:
         """Get row choice when player must wipe a row.
         
         Args:
             player: Player who must choose
             table: Table with rows to choose from
-            all_selections: List of (player_name, card) tuples for all selections
+            all_selections: (player_name, card) tuples for all selections,
+                sorted by card value
+            choices_text: Pre-rendered table and row choices, reused across
+                players since the table does not change before the turn resolves
             
         Returns:
             Zero-based row index (0-3)
@@ -144,31 +210,40 @@ class InputHandler:
         
         if all_selections:
             print(colors.colored_text("Cards being played this turn:", colors.INFO))
-            for name, card in sorted(all_selections, key=lambda x: x[1].value):
+            for name, card in all_selections:
                 card_text = colors.colored_card(card.value, card.points)
                 print(f"  {colors.colored_text(name, colors.PLAYER_NAME)}: {card_text}")
             print()
         
-        GameDisplay.show_table(table)
-        GameDisplay.show_row_choices(table)
+        if choices_text is None:
+            choices_text = InputHandler.render_row_choice_screen(table)
+        print(choices_text)
         
         while True:
-            try:
-                choice = GameDisplay.prompt_for_input("Choose row to take (1-4, or 'q' to quit): ")
-                
-                if choice.strip().lower() == 'q':
-                    raise KeyboardInterrupt("User quit game")
-                
-                row_index = int(choice.strip()) - 1
-                
-                if not 0 <= row_index < 4:
-                    GameDisplay.show_message("Please enter 1, 2, 3, or 4", "error")
-                    continue
-                
-                return row_index
-                
-            except ValueError:
-                GameDisplay.show_message("Please enter a valid number", "error")
+            choice = _prompt("Choose row to take (1-4, or 'q' to quit): ")
+            
+            if choice.strip().lower() == 'q':
+                raise KeyboardInterrupt("User quit game")
+            
+            row_number = _parse_int(choice, 1, 4)
+            
+            if row_number is None:
+                GameDisplay.show_message("Please enter 1, 2, 3, or 4", "error")
+                continue
+            
+            return row_number - 1
+    
+    @staticmethod
+    def render_row_choice_screen(table: Table) -> str:
+        """Render the table and row choices shown when wiping.
+        
+        Args:
+            table: Table with rows to choose from
+            
+        Returns:
+            Combined table and row choice text
+        """
+        return GameDisplay.render_table(table) + "\n" + GameDisplay.render_row_choices(table)
     
     @staticmethod
     def confirm_play_again() -> bool:
@@ -178,11 +253,11 @@ class InputHandler:
             True if players want another game
         """
         while True:
-            choice = GameDisplay.prompt_for_input("Play another game? (y/n): ").strip().lower()
+            choice = _prompt("Play another game? (y/n): ").lstrip()[:1]
             
-            if choice in ['y', 'yes']:
+            if choice in _YES:
                 return True
-            elif choice in ['n', 'no']:
+            elif choice in _NO:
                 return False
             else:
                 GameDisplay.show_message("Please enter 'y' for yes or 'n' for no", "error")
@@ -194,9 +269,10 @@ class InputHandler:
         Args:
             round_num: Round number starting
         """
-        colors.clear_screen()
-        GameDisplay.show_title()
-        GameDisplay.show_message(f"Starting Round {round_num}...", "info")
+        with _buffered_stdout():
+            colors.clear_screen()
+            GameDisplay.show_title()
+            GameDisplay.show_message(f"Starting Round {round_num}...", "info")
         GameDisplay.wait_for_enter()
     
     @staticmethod
@@ -218,9 +294,10 @@ class InputHandler:
             results: List of (player, card, row_index, wiped_cards) tuples
             table: Updated table state
         """
-        colors.clear_screen()
-        GameDisplay.show_turn_results(results)
-        GameDisplay.show_table(table)
+        with _buffered_stdout():
+            colors.clear_screen()
+            GameDisplay.show_turn_results(results)
+            GameDisplay.show_table(table)
         GameDisplay.wait_for_enter()
     
     @staticmethod
@@ -231,7 +308,8 @@ class InputHandler:
             players: List of players with updated scores
             round_num: Round number that just ended
         """
-        colors.clear_screen()
-        GameDisplay.show_message(f"Round {round_num} Complete!", "success")
-        GameDisplay.show_scores(players, show_round_scores=True)
+        with _buffered_stdout():
+            colors.clear_screen()
+            GameDisplay.show_message(f"Round {round_num} Complete!", "success")
+            GameDisplay.show_scores(players, show_round_scores=True)
         GameDisplay.wait_for_enter()
@@ -3,6 +3,28 @@
 
 import sys
 import os
+import platform
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Import game and UI modules once; the checks below report and reuse the result
+try:
+    from game.card import Card, Deck
+    from game.player import Player
+    from game.table import Table
+    from game.rules import GameRules
+    from game.game import Game
+    _GAME_IMPORT_ERROR = None
+except ImportError as e:
+    _GAME_IMPORT_ERROR = e
+
+try:
+    from ui.display import GameDisplay
+    from ui.input import InputHandler
+    from ui.colors import colors
+    _UI_IMPORT_ERROR = None
+except ImportError as e:
+    _UI_IMPORT_ERROR = e
 
 def check_python_version():
     """Check if Python version is 3.8+."""
@@ -17,41 +39,38 @@ def check_dependencies():
     try:
         import colorama
         print("✅ colorama available")
-        return True
     except ImportError:
         print("❌ colorama not found. Run: pip install colorama")
         return False
+    
+    implementation = platform.python_implementation()
+    if implementation == "CPython":
+        print("ℹ️  For best performance, run under PyPy3 (the game is pure Python)")
+    else:
+        print(f"✅ Running under {implementation}")
+    return True
 
 def check_game_imports():
     """Check if game modules can be imported."""
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+    if _GAME_IMPORT_ERROR is not None:
+        print(f"❌ Import error: {_GAME_IMPORT_ERROR}")
+        return False
+    print("✅ Game logic modules")
     
-    try:
-        from game.card import Card, Deck
-        from game.player import Player
-        from game.table import Table
-        from game.rules import GameRules
-        from game.game import Game
-        print("✅ Game logic modules")
-        
-        from ui.display import GameDisplay
-        from ui.input import InputHandler
-        from ui.colors import colors
-        print("✅ UI modules")
-        
-        return True
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
+    if _UI_IMPORT_ERROR is not None:
+        print(f"❌ Import error: {_UI_IMPORT_ERROR}")
         return False
+    print("✅ UI modules")
+    
+    return True
 
 def test_basic_functionality():
     """Test basic game functionality."""
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+    if _GAME_IMPORT_ERROR is not None:
+        print(f"❌ Functionality test skipped: {_GAME_IMPORT_ERROR}")
+        return False
     
     try:
-        from game.card import Card, Deck
-        from game.game import Game
-        
         # Test card creation and scoring
         card = Card(55)
         assert card.points == 7, "Card 55 should have 7 points"
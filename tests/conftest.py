@@ -12,14 +12,43 @@ from game.player import Player
 from game.table import Table, Row
 from game.game import Game
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def deal_and_select():
+    """Provide a helper that gives a player one card and selects it.
+    
+    Returns:
+        Function taking (player, card) that deals card to player and
+        selects it
+    """
+    def deal(player, card):
+        player.deal_cards([card])
+        player.select_card(card)
+    return deal
+
+@pytest.fixture(scope="session")
+def empty_hand():
+    """Provide a helper that plays out a player's whole hand.
+    
+    Returns:
+        Function taking a player and selecting then playing each card
+        until the hand is empty
+    """
+    def play_all(player):
+        while player.hand_size:
+            player.select_card(player.get_card_by_index(0))
+            player.play_selected_card()
+    return play_all
+
+@pytest.fixture(scope="session")
 def sample_cards():
     """Provide sample cards for testing.
     
+    Cards are immutable, so one tuple is shared across the session.
+    
     Returns:
-        List of cards with known values
+        Tuple of cards with known values
     """
-    return [Card(10), Card(20), Card(55), Card(77), Card(104)]
+    return (Card(10), Card(20), Card(55), Card(77), Card(104))
 
 @pytest.fixture
 def sample_deck():
@@ -50,10 +79,49 @@ def sample_table():
     return Table(starting_cards)
 
 @pytest.fixture
-def sample_game():
-    """Provide a sample game for testing.
+def abc_players():
+    """Provide three new players for tests that change their state.
+    
+    Returns:
+        List of players Alice, Bob and Charlie with empty hands
+    """
+    return [Player("Alice"), Player("Bob"), Player("Charlie")]
+
+@pytest.fixture(scope="session")
+def default_table_cards():
+    """Provide the standard starting cards for table tests.
+    
+    Returns:
+        Tuple of cards 10, 20, 30 and 40, one per row
+    """
+    return (Card(10), Card(20), Card(30), Card(40))
+
+@pytest.fixture
+def fresh_table(default_table_cards):
+    """Provide a new table for tests that mutate it.
+    
+    Returns:
+        Table with rows starting at 10, 20, 30 and 40
+    """
+    return Table(list(default_table_cards))
+
+@pytest.fixture
+def fresh_game():
+    """Provide a new game for tests that mutate it.
     
     Returns:
         Game with 3 players
     """
     return Game(["Alice", "Bob", "Charlie"])
+
+@pytest.fixture(scope="module")
+def readonly_game():
+    """Provide a shared game for tests that only inspect it.
+    
+    Tests using this fixture must not start rounds, select cards or
+    change scores, since the same instance is reused across the module.
+    
+    Returns:
+        Game with 3 players and no round started
+    """
+    return Game(["Alice", "Bob", "Charlie"])
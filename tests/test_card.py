@@ -1,5 +1,6 @@
 """Unit tests for Card and Deck classes."""
 
+import random
 import pytest
 from game.card import Card, Deck
 
@@ -21,43 +22,28 @@ class TestCard:
         with pytest.raises(ValueError):
             Card(-5)
     
-    def test_card_points_base(self):
-        """Test base point calculation (1 point)."""
-        assert Card(1).points == 1
-        assert Card(2).points == 1
-        assert Card(3).points == 1
-        assert Card(4).points == 1
-    
-    def test_card_points_multiple_of_5(self):
-        """Test points for multiples of 5 (2 points)."""
-        assert Card(5).points == 2
-        assert Card(15).points == 2
-        assert Card(25).points == 2
-        assert Card(35).points == 2
-        assert Card(45).points == 2
-    
-    def test_card_points_multiple_of_10(self):
-        """Test points for multiples of 10 (3 points)."""
-        assert Card(10).points == 3
-        assert Card(20).points == 3
-        assert Card(30).points == 3
-        assert Card(40).points == 3
-        assert Card(100).points == 3
-    
-    def test_card_points_multiple_of_11(self):
-        """Test points for multiples of 11 (5 points)."""
-        assert Card(11).points == 5
-        assert Card(22).points == 5
-        assert Card(33).points == 5
-        assert Card(44).points == 5
-        assert Card(66).points == 5
-        assert Card(77).points == 5
-        assert Card(88).points == 5
-        assert Card(99).points == 5
-    
-    def test_card_points_special_55(self):
-        """Test special case of 55 (7 points)."""
-        assert Card(55).points == 7
+    @pytest.mark.parametrize("value,expected", [
+        # Base: 1 point
+        (1, 1), (2, 1), (3, 1), (4, 1),
+        # Multiples of 5: 2 points
+        (5, 2), (15, 2), (25, 2), (35, 2), (45, 2),
+        # Multiples of 10: 3 points
+        (10, 3), (20, 3), (30, 3), (40, 3), (100, 3),
+        # Multiples of 11: 5 points
+        (11, 5), (22, 5), (33, 5), (44, 5), (66, 5), (77, 5), (88, 5), (99, 5),
+        # Special case: 55 = 7 points
+        (55, 7),
+    ])
+    def test_card_points(self, value, expected):
+        """Test penalty point calculation for each scoring category."""
+        assert Card(value).points == expected
+    
+    def test_card_points_read_only(self):
+        """Test points cannot be reassigned on a card."""
+        card = Card(10)
+        with pytest.raises(AttributeError):
+            card.points = 99
+        assert card.points == 3
     
     def test_card_equality(self):
         """Test card equality comparison."""
@@ -131,6 +117,16 @@ class TestDeck:
         assert deck.remaining_cards == 94
         assert all(isinstance(card, Card) for card in cards)
     
+    def test_deck_deal_cards_matches_single_deals(self):
+        """Test dealing n cards at once gives the same order as n single deals."""
+        random.seed(1234)
+        batch_deck = Deck()
+        random.seed(1234)
+        single_deck = Deck()
+        
+        assert batch_deck.deal_cards(10) == [single_deck.deal_card() for _ in range(10)]
+        assert batch_deck.deal_cards(94) == [single_deck.deal_card() for _ in range(94)]
+    
     def test_deck_deal_from_empty(self):
         """Test dealing from empty deck raises error."""
         deck = Deck()
@@ -4,6 +4,9 @@ import pytest
 from game.game import Game, GameState
 from game.card import Card
 from game.player import Player
+from game.table import Table
+
+ALL_VALUES = frozenset(range(1, 105))
 
 
 class TestGameState:
@@ -22,9 +25,9 @@ class TestGameState:
 class TestGame:
     """Tests for Game class."""
     
-    def test_game_creation_valid(self):
+    def test_game_creation_valid(self, readonly_game):
         """Test creating game with valid players."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = readonly_game
         
         assert len(game.players) == 3
         assert game.players[0].name == "Alice"
@@ -46,9 +49,9 @@ class TestGame:
         with pytest.raises(ValueError):
             Game(["Alice", "Bob", "Alice"])
     
-    def test_start_new_round(self):
+    def test_start_new_round(self, fresh_game):
         """Test starting a new round."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         
         game.start_new_round()
         
@@ -61,9 +64,9 @@ class TestGame:
         for player in game.players:
             assert player.hand_size == 10
     
-    def test_select_card_for_player(self):
+    def test_select_card_for_player(self, fresh_game):
         """Test selecting a card for a player."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         game.start_new_round()
         
         player = game.players[0]
@@ -74,28 +77,22 @@ class TestGame:
         assert player.selected_card == card
         assert player.has_selected_card
     
-    def test_select_card_invalid(self):
+    def test_select_card_invalid(self, fresh_game):
         """Test selecting invalid card."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         game.start_new_round()
         
         player = game.players[0]
-        # Find a card definitely not in hand by checking all values
-        hand_values = set(card.value for card in player.hand)
-        invalid_value = None
-        for value in range(1, 105):
-            if value not in hand_values:
-                invalid_value = value
-                break
-        
-        if invalid_value:
-            invalid_card = Card(invalid_value)
-            with pytest.raises(ValueError):
-                game.select_card_for_player(player, invalid_card)
+        # Find a card definitely not in hand
+        invalid_value = min(ALL_VALUES - {held.value for held in player.hand})
+        
+        invalid_card = Card(invalid_value)
+        with pytest.raises(ValueError):
+            game.select_card_for_player(player, invalid_card)
     
-    def test_all_players_selected(self):
+    def test_all_players_selected(self, fresh_game):
         """Test checking if all players have selected."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         game.start_new_round()
         
         assert not game.all_players_selected()
@@ -107,9 +104,20 @@ class TestGame:
         
         assert game.all_players_selected()
     
-    def test_process_turn(self):
+    def test_all_players_selected_directly(self, fresh_game):
+        """Test selections made on the players themselves are counted."""
+        game = fresh_game
+        game.start_new_round()
+        
+        for player in game.players:
+            player.select_card(player.hand[0])
+        
+        assert game.all_players_selected()
+        assert len(game.process_turn()) == 3
+    
+    def test_process_turn(self, fresh_game):
         """Test processing a complete turn."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         game.start_new_round()
         
         # Select cards for all players
@@ -127,9 +135,9 @@ class TestGame:
             assert not player.has_selected_card
             assert player.hand_size == 9  # One card played
     
-    def test_process_turn_without_selections(self):
+    def test_process_turn_without_selections(self, fresh_game):
         """Test processing turn without all selections."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         game.start_new_round()
         
         # Only select for one player
@@ -138,9 +146,25 @@ class TestGame:
         with pytest.raises(ValueError):
             game.process_turn()
     
-    def test_is_round_over(self):
+    def test_process_turn_after_selection_cleared(self, fresh_game):
+        """Test a selection cleared after a row-choice check stops the turn cleanly."""
+        game = fresh_game
+        game.start_new_round()
+        
+        for player in game.players:
+            game.select_card_for_player(player, player.hand[0])
+        game.get_players_needing_row_choice()
+        game.players[1].clear_selection()
+        
+        with pytest.raises(ValueError):
+            game.process_turn()
+        
+        assert game.state.turn_number == 0
+        assert all(player.hand_size == 10 for player in game.players)
+    
+    def test_is_round_over(self, fresh_game):
         """Test checking if round is over."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         game.start_new_round()
         
         assert not game.is_round_over()
@@ -157,9 +181,9 @@ class TestGame:
         
         assert game.is_round_over()
     
-    def test_check_game_end(self):
+    def test_check_game_end(self, fresh_game):
         """Test checking and setting game end."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         game.start_new_round()
         
         # Give one player >50 points
@@ -170,9 +194,9 @@ class TestGame:
         assert game.state.winner is not None
         assert game.state.winner.name == "Bob" or game.state.winner.name == "Charlie"  # Lowest score
     
-    def test_get_scores(self):
+    def test_get_scores(self, fresh_game):
         """Test getting player scores."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         
         game.players[0].add_penalty_points(10)
         game.players[1].add_penalty_points(20)
@@ -185,9 +209,9 @@ class TestGame:
         assert scores[1] == ("Bob", 20, 20)
         assert scores[2] == ("Charlie", 15, 15)
     
-    def test_get_player_by_name(self):
+    def test_get_player_by_name(self, readonly_game):
         """Test finding player by name."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = readonly_game
         
         player = game.get_player_by_name("Bob")
         assert player is not None
@@ -196,9 +220,9 @@ class TestGame:
         player = game.get_player_by_name("David")
         assert player is None
     
-    def test_clear_all_selections(self):
+    def test_clear_all_selections(self, fresh_game):
         """Test clearing all player selections."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         game.start_new_round()
         
         # Select cards for all players
@@ -212,20 +236,20 @@ class TestGame:
             assert not player.has_selected_card
             assert player.selected_card is None
     
-    def test_set_forced_row_choice(self):
+    def test_set_forced_row_choice(self, fresh_game):
         """Test setting forced row choice for player."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         game.start_new_round()
         
         player = game.players[0]
         
         game.set_forced_row_choice(player, 2)
-        assert hasattr(player, '_forced_row_choice')
-        assert player._forced_row_choice == 2
+        assert game._forced_row_choices[id(player)] == 2
+        assert not hasattr(player, '_forced_row_choice')
     
-    def test_set_forced_row_choice_invalid(self):
+    def test_set_forced_row_choice_invalid(self, fresh_game):
         """Test setting invalid forced row choice."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         game.start_new_round()
         
         player = game.players[0]
@@ -236,9 +260,26 @@ class TestGame:
         with pytest.raises(ValueError):
             game.set_forced_row_choice(player, 4)
     
-    def test_get_players_needing_row_choice(self):
+    @pytest.mark.parametrize("values,expected", [
+        ((5, 25, 35), [("Alice", 5)]),  # Lowest card is below every row end
+        ((15, 25, 35), []),  # Lowest card fits after 10
+        ((7, 3, 50), [("Bob", 3)]),  # Only the lowest of two low cards chooses
+    ])
+    def test_get_players_needing_row_choice_exact(self, fresh_game, values, expected):
+        """Test exactly which player must wipe on a fixed table."""
+        game = fresh_game
+        game._table = Table([Card(10), Card(20), Card(30), Card(40)])
+        for player, value in zip(game.players, values):
+            player.deal_cards([Card(value)])
+            game.select_card_for_player(player, Card(value))
+        
+        needing_choice = game.get_players_needing_row_choice()
+        
+        assert [(p.name, c.value) for p, c in needing_choice] == expected
+    
+    def test_get_players_needing_row_choice(self, fresh_game):
         """Test identifying players who must wipe rows."""
-        game = Game(["Alice", "Bob", "Charlie"])
+        game = fresh_game
         game.start_new_round()
         
         # Find a card that's lower than all table cards
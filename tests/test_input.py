@@ -0,0 +1,35 @@
+"""Unit tests for input parsing helpers."""
+
+import pytest
+import ui.input
+from ui.input import _parse_int, _prompt
+
+
+class TestParseInt:
+    """Tests for _parse_int helper."""
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("", None),
+        (" 3 ", 3),
+        ("-1", None),
+        ("3.0", None),
+        ("abc", None),
+        ("0", None),  # Just below bounds
+        ("1", 1),
+        ("10", 10),
+        ("11", None),  # Just above bounds
+    ])
+    def test_parse_int(self, text, expected):
+        """Test parsing whole numbers between 1 and 10."""
+        assert _parse_int(text, 1, 10) == expected
+
+
+class TestPrompt:
+    """Tests for _prompt helper."""
+    
+    def test_prompt_writes_to_current_stdout(self, capsys, monkeypatch):
+        """Test the prompt goes to whatever stdout is current when called."""
+        monkeypatch.setattr(ui.input, "_STDIN_READLINE", lambda: "3\n")
+        
+        assert _prompt("Pick: ") == "3"
+        assert "Pick: " in capsys.readouterr().out
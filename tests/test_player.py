@@ -4,6 +4,9 @@ import pytest
 from game.player import Player
 from game.card import Card
 
+# Cards are immutable, so one instance per value is shared by every test
+C10, C20, C30 = (Card(v) for v in (10, 20, 30))
+
 
 class TestPlayer:
     """Tests for Player class."""
@@ -11,11 +14,10 @@ class TestPlayer:
     def test_player_creation_valid(self):
         """Test creating player with valid name."""
         player = Player("Alice")
-        assert player.name == "Alice"
-        assert player.hand_size == 0
-        assert player.total_score == 0
-        assert player.round_score == 0
-        assert player.selected_card is None
+        assert (
+            player.name, player.hand_size, player.total_score,
+            player.round_score, player.selected_card,
+        ) == ("Alice", 0, 0, 0, None)
     
     def test_player_creation_invalid(self):
         """Test player creation with invalid names."""
@@ -26,6 +28,14 @@ class TestPlayer:
         with pytest.raises(ValueError):
             Player("\t\n")
     
+    def test_hand_state_read_only(self):
+        """Test hand size and selection flag cannot be reassigned."""
+        player = Player("Alice")
+        with pytest.raises(AttributeError):
+            player.hand_size = 5
+        with pytest.raises(AttributeError):
+            player.has_selected_card = True
+    
     def test_player_name_stripped(self):
         """Test that player names are stripped of whitespace."""
         player = Player("  Bob  ")
@@ -34,16 +44,16 @@ class TestPlayer:
     def test_deal_cards_to_player(self):
         """Test dealing cards to player's hand."""
         player = Player("Alice")
-        cards = [Card(10), Card(20), Card(30)]
+        cards = [C10, C20, C30]
         
         player.deal_cards(cards)
         assert player.hand_size == 3
-        assert all(card in player.hand for card in cards)
+        assert set(player.hand) == set(cards)
     
     def test_player_hand_sorted(self):
         """Test that player's hand is always sorted."""
         player = Player("Alice")
-        cards = [Card(30), Card(10), Card(20)]
+        cards = [C30, C10, C20]
         
         player.deal_cards(cards)
         hand_values = [card.value for card in player.hand]
@@ -52,9 +62,9 @@ class TestPlayer:
     def test_has_card(self):
         """Test checking if player has specific card."""
         player = Player("Alice")
-        card1 = Card(10)
-        card2 = Card(20)
-        card3 = Card(30)
+        card1 = C10
+        card2 = C20
+        card3 = C30
         
         player.deal_cards([card1, card2])
         
@@ -65,7 +75,7 @@ class TestPlayer:
     def test_select_card_valid(self):
         """Test selecting a card from hand."""
         player = Player("Alice")
-        card = Card(10)
+        card = C10
         player.deal_cards([card])
         
         player.select_card(card)
@@ -75,8 +85,8 @@ class TestPlayer:
     def test_select_card_not_in_hand(self):
         """Test selecting card not in hand raises error."""
         player = Player("Alice")
-        card1 = Card(10)
-        card2 = Card(20)
+        card1 = C10
+        card2 = C20
         player.deal_cards([card1])
         
         with pytest.raises(ValueError):
@@ -85,8 +95,8 @@ class TestPlayer:
     def test_select_card_already_selected(self):
         """Test selecting when already selected raises error."""
         player = Player("Alice")
-        card1 = Card(10)
-        card2 = Card(20)
+        card1 = C10
+        card2 = C20
         player.deal_cards([card1, card2])
         
         player.select_card(card1)
@@ -96,7 +106,7 @@ class TestPlayer:
     def test_play_selected_card(self):
         """Test playing the selected card."""
         player = Player("Alice")
-        card = Card(10)
+        card = C10
         player.deal_cards([card])
         player.select_card(card)
         
@@ -145,7 +155,7 @@ class TestPlayer:
     def test_clear_selection(self):
         """Test clearing card selection."""
         player = Player("Alice")
-        card = Card(10)
+        card = C10
         player.deal_cards([card])
         player.select_card(card)
         
@@ -157,8 +167,7 @@ class TestPlayer:
     def test_get_card_by_index(self):
         """Test getting card from hand by index."""
         player = Player("Alice")
-        cards = [Card(10), Card(20), Card(30)]
-        player.deal_cards(cards)
+        player.deal_cards([C10, C20, C30])
         
         assert player.get_card_by_index(0).value == 10
         assert player.get_card_by_index(1).value == 20
@@ -167,8 +176,7 @@ class TestPlayer:
     def test_get_card_invalid_index(self):
         """Test getting card with invalid index."""
         player = Player("Alice")
-        cards = [Card(10), Card(20)]
-        player.deal_cards(cards)
+        player.deal_cards([C10, C20])
         
         with pytest.raises(IndexError):
             player.get_card_by_index(-1)
@@ -179,7 +187,7 @@ class TestPlayer:
         """Test player string representations."""
         player = Player("Alice")
         player.add_penalty_points(15)
-        player.deal_cards([Card(10), Card(20)])
+        player.deal_cards([C10, C20])
         
         assert str(player) == "Alice (Score: 15)"
         assert repr(player) == "Player('Alice', score=15, hand_size=2)"
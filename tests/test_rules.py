@@ -5,27 +5,26 @@ from game.rules import GameRules
 from game.player import Player
 from game.card import Card
 
+# Cards are immutable, so one instance per value is shared by every test
+C1, C5, C10, C11, C20, C30, C40, C50, C55 = (
+    Card(v) for v in (1, 5, 10, 11, 20, 30, 40, 50, 55)
+)
+
 
 class TestGameRules:
     """Tests for GameRules class."""
     
-    def test_validate_player_count_valid(self):
+    @pytest.mark.parametrize("count", [3, 5, 10])
+    def test_validate_player_count_valid(self, count):
         """Test valid player counts."""
-        GameRules.validate_player_count(3)
-        GameRules.validate_player_count(5)
-        GameRules.validate_player_count(10)
+        GameRules.validate_player_count(count)
         # Should not raise any exceptions
     
-    def test_validate_player_count_invalid(self):
+    @pytest.mark.parametrize("count", [2, 11, 0, -1])
+    def test_validate_player_count_invalid(self, count):
         """Test invalid player counts."""
         with pytest.raises(ValueError):
-            GameRules.validate_player_count(2)
-        with pytest.raises(ValueError):
-            GameRules.validate_player_count(11)
-        with pytest.raises(ValueError):
-            GameRules.validate_player_count(0)
-        with pytest.raises(ValueError):
-            GameRules.validate_player_count(-1)
+            GameRules.validate_player_count(count)
     
     def test_validate_player_names_valid(self):
         """Test valid player name lists."""
@@ -57,19 +56,18 @@ class TestGameRules:
         with pytest.raises(ValueError):
             GameRules.validate_player_names(["Alice", "  Alice  "])
     
-    def test_calculate_cards_needed(self):
+    @pytest.mark.parametrize("player_count,expected", [
+        (3, 34),  # 3*10 + 4
+        (5, 54),  # 5*10 + 4
+        (10, 104),  # 10*10 + 4
+    ])
+    def test_calculate_cards_needed(self, player_count, expected):
         """Test calculating cards needed for game."""
-        assert GameRules.calculate_cards_needed(3) == 34  # 3*10 + 4
-        assert GameRules.calculate_cards_needed(5) == 54  # 5*10 + 4
-        assert GameRules.calculate_cards_needed(10) == 104  # 10*10 + 4
+        assert GameRules.calculate_cards_needed(player_count) == expected
     
-    def test_is_game_over(self):
+    def test_is_game_over(self, abc_players):
         """Test checking if game is over."""
-        players = [
-            Player("Alice"),
-            Player("Bob"),
-            Player("Charlie")
-        ]
+        players = abc_players
         
         # No one over threshold
         players[0].add_penalty_points(30)
@@ -81,13 +79,9 @@ class TestGameRules:
         players[0].add_penalty_points(21)  # Total 51
         assert GameRules.is_game_over(players)
     
-    def test_find_winner(self):
+    def test_find_winner(self, abc_players):
         """Test finding winner with lowest score."""
-        players = [
-            Player("Alice"),
-            Player("Bob"),
-            Player("Charlie")
-        ]
+        players = abc_players
         
         players[0].add_penalty_points(30)
         players[1].add_penalty_points(20)  # Lowest
@@ -101,7 +95,7 @@ class TestGameRules:
         with pytest.raises(ValueError):
             GameRules.find_winner([])
     
-    def test_is_round_over(self):
+    def test_is_round_over(self, empty_hand):
         """Test checking if round is over."""
         players = [
             Player("Alice"),
@@ -109,20 +103,13 @@ class TestGameRules:
         ]
         
         # Players have cards
-        players[0].deal_cards([Card(10), Card(20)])
-        players[1].deal_cards([Card(30), Card(40)])
+        players[0].deal_cards([C10, C20])
+        players[1].deal_cards([C30, C40])
         assert not GameRules.is_round_over(players)
         
         # Play all cards
-        players[0].select_card(Card(10))
-        players[0].play_selected_card()
-        players[0].select_card(Card(20))
-        players[0].play_selected_card()
-        
-        players[1].select_card(Card(30))
-        players[1].play_selected_card()
-        players[1].select_card(Card(40))
-        players[1].play_selected_card()
+        for player in players:
+            empty_hand(player)
         
         assert GameRules.is_round_over(players)
     
@@ -133,49 +120,37 @@ class TestGameRules:
             Player("Bob")
         ]
         
-        cards = [Card(10), Card(20), Card(30), Card(40)]
-        players[0].deal_cards(cards[:2])
-        players[1].deal_cards(cards[2:])
+        players[0].deal_cards([C10, C20])
+        players[1].deal_cards([C30, C40])
         
         # No selections
         assert not GameRules.all_players_selected(players)
         
         # One player selected
-        players[0].select_card(Card(10))
+        players[0].select_card(C10)
         assert not GameRules.all_players_selected(players)
         
         # All selected
-        players[1].select_card(Card(30))
+        players[1].select_card(C30)
         assert GameRules.all_players_selected(players)
     
-    def test_calculate_penalty_points(self):
+    @pytest.mark.parametrize("cards,expected", [
+        ([C1, C5, C10, C11, C55], 18),  # 1 + 2 + 3 + 5 + 7
+        ([C20, C30, C40], 9),  # 3 points each
+        ([C55], 7),
+        ([], 0),
+    ])
+    def test_calculate_penalty_points(self, cards, expected):
         """Test calculating total penalty points."""
-        cards = [
-            Card(1),   # 1 point
-            Card(5),   # 2 points
-            Card(10),  # 3 points
-            Card(11),  # 5 points
-            Card(55)   # 7 points
-        ]
-        
-        assert GameRules.calculate_penalty_points(cards) == 18
-        assert GameRules.calculate_penalty_points([]) == 0
+        assert GameRules.calculate_penalty_points(cards) == expected
     
-    def test_sort_players_by_card_value(self):
+    def test_sort_players_by_card_value(self, abc_players, deal_and_select):
         """Test sorting players by selected card values."""
-        players = [
-            Player("Alice"),
-            Player("Bob"),
-            Player("Charlie")
-        ]
-        
-        players[0].deal_cards([Card(50)])
-        players[1].deal_cards([Card(10)])
-        players[2].deal_cards([Card(30)])
+        players = abc_players
         
-        players[0].select_card(Card(50))
-        players[1].select_card(Card(10))
-        players[2].select_card(Card(30))
+        deal_and_select(players[0], C50)
+        deal_and_select(players[1], C10)
+        deal_and_select(players[2], C30)
         
         sorted_players = GameRules.sort_players_by_card_value(players)
         
@@ -186,7 +161,7 @@ class TestGameRules:
     def test_validate_card_selection_valid(self):
         """Test valid card selection."""
         player = Player("Alice")
-        card = Card(10)
+        card = C10
         player.deal_cards([card])
         
         GameRules.validate_card_selection(player, card)
@@ -195,16 +170,16 @@ class TestGameRules:
     def test_validate_card_selection_not_in_hand(self):
         """Test selecting card not in hand."""
         player = Player("Alice")
-        player.deal_cards([Card(10)])
+        player.deal_cards([C10])
         
         with pytest.raises(ValueError):
-            GameRules.validate_card_selection(player, Card(20))
+            GameRules.validate_card_selection(player, C20)
     
     def test_validate_card_selection_already_selected(self):
         """Test selecting when already selected."""
         player = Player("Alice")
-        card1 = Card(10)
-        card2 = Card(20)
+        card1 = C10
+        card2 = C20
         player.deal_cards([card1, card2])
         player.select_card(card1)
         
@@ -4,88 +4,103 @@ import pytest
 from game.table import Table, Row
 from game.card import Card
 
+# Cards are immutable, so one instance per value is shared by every test
+C5, C10, C11, C12, C13, C14, C15, C19, C20, C21, C25, C30, C40, C45, C50, C55, C77, C100 = (
+    Card(v) for v in (5, 10, 11, 12, 13, 14, 15, 19, 20, 21, 25, 30, 40, 45, 50, 55, 77, 100)
+)
+
 
 class TestRow:
     """Tests for Row class."""
     
     def test_row_creation(self):
         """Test creating row with starting card."""
-        card = Card(50)
+        card = C50
         row = Row(card)
         
-        assert row.cards == [card]
-        assert row.last_card == card
-        assert row.card_count == 1
-        assert not row.is_full
+        assert (row.cards, row.last_card, row.card_count, row.is_full) == ([card], card, 1, False)
     
-    def test_row_can_place_card(self):
+    @pytest.mark.parametrize("candidate,expected", [
+        (C21, True),
+        (C100, True),
+        (C20, False),  # Same value
+        (C19, False),  # Lower value
+    ])
+    def test_row_can_place_card(self, candidate, expected):
         """Test checking if card can be placed."""
-        row = Row(Card(20))
-        
-        assert row.can_place_card(Card(21))
-        assert row.can_place_card(Card(100))
-        assert not row.can_place_card(Card(20))  # Same value
-        assert not row.can_place_card(Card(19))  # Lower value
+        assert Row(C20).can_place_card(candidate) is expected
     
     def test_row_place_card_valid(self):
         """Test placing valid cards in row."""
-        row = Row(Card(20))
+        row = Row(C20)
         
-        result = row.place_card(Card(30))
-        assert result is None  # No cards wiped
-        assert row.card_count == 2
-        assert row.last_card.value == 30
+        result = row.place_card(C30)
+        # No cards wiped
+        assert (result, row.card_count, row.last_card.value) == (None, 2, 30)
     
     def test_row_place_card_invalid(self):
         """Test placing invalid card raises error."""
-        row = Row(Card(20))
+        row = Row(C20)
         
         with pytest.raises(ValueError):
-            row.place_card(Card(10))
+            row.place_card(C10)
     
     def test_row_full_after_five_cards(self):
         """Test row becomes full with 5 cards."""
-        row = Row(Card(10))
+        row = Row(C10)
         
-        row.place_card(Card(20))
-        row.place_card(Card(30))
-        row.place_card(Card(40))
+        row.place_card(C20)
+        row.place_card(C30)
+        row.place_card(C40)
         assert not row.is_full
         
-        wiped = row.place_card(Card(50))
+        wiped = row.place_card(C50)
         assert not row.is_full  # After wiping, only 1 card left
         assert wiped is not None
         assert len(wiped) == 4
         assert row.card_count == 1
         assert row.last_card.value == 50
+        assert row.total_points == 3  # Only card 50 remains
     
     def test_row_wipe_and_replace(self):
         """Test wiping row and replacing with new card."""
-        row = Row(Card(10))
-        row.place_card(Card(20))
-        row.place_card(Card(30))
+        row = Row(C10)
+        row.place_card(C20)
+        row.place_card(C30)
         
-        wiped = row.wipe_and_replace(Card(5))
+        wiped = row.wipe_and_replace(C5)
         
-        assert len(wiped) == 3
-        assert wiped[0].value == 10
-        assert wiped[1].value == 20
-        assert wiped[2].value == 30
+        assert tuple(card.value for card in wiped) == (10, 20, 30)
         assert row.card_count == 1
         assert row.last_card.value == 5
-    
-    def test_row_total_points(self):
+        assert row.total_points == 2  # Only card 5 remains
+    
+    @pytest.mark.parametrize("cards,expected", [
+        ((C10, C55, C77), 15),  # 3 + 7 + 5
+        ((C11, C12, C13), 7),  # 5 + 1 + 1
+        ((C5, C10, C11, C55), 17),  # 2 + 3 + 5 + 7
+        ((C100,), 3),
+    ])
+    def test_row_total_points(self, cards, expected):
         """Test calculating total points in row."""
-        row = Row(Card(10))  # 3 points
-        row.place_card(Card(55))  # 7 points
-        row.place_card(Card(77))  # 5 points (must be higher than 55)
+        row = Row(cards[0])
+        for card in cards[1:]:
+            row.place_card(card)
         
-        assert row.total_points == 15
+        assert row.total_points == expected
+    
+    def test_row_iteration(self):
+        """Test iterating over row cards directly."""
+        row = Row(C10)
+        row.place_card(C20)
+        
+        assert [card.value for card in row] == [10, 20]
+        assert len(row) == 2
     
     def test_row_string_representation(self):
         """Test row string representation."""
-        row = Row(Card(10))
-        row.place_card(Card(20))
+        row = Row(C10)
+        row.place_card(C20)
         
         assert str(row) == "[10] [20]"
 
@@ -95,113 +110,136 @@ class TestTable:
     
     def test_table_creation_valid(self):
         """Test creating table with 4 starting cards."""
-        cards = [Card(10), Card(20), Card(30), Card(40)]
+        cards = [C10, C20, C30, C40]
         table = Table(cards)
         
-        assert len(table.rows) == 4
-        for i, row in enumerate(table.rows):
-            assert row.last_card.value == cards[i].value
+        assert [row.last_card for row in table.rows] == cards
     
     def test_table_creation_invalid(self):
         """Test table creation with wrong number of cards."""
         with pytest.raises(ValueError):
-            Table([Card(10), Card(20), Card(30)])
+            Table([C10, C20, C30])
         
         with pytest.raises(ValueError):
-            Table([Card(10), Card(20), Card(30), Card(40), Card(50)])
+            Table([C10, C20, C30, C40, C50])
     
     def test_get_row_valid(self):
         """Test getting specific row by index."""
-        cards = [Card(10), Card(20), Card(30), Card(40)]
+        cards = [C10, C20, C30, C40]
         table = Table(cards)
         
         assert table.get_row(0).last_card.value == 10
         assert table.get_row(3).last_card.value == 40
     
-    def test_get_row_invalid(self):
+    def test_get_row_invalid(self, fresh_table):
         """Test getting row with invalid index."""
-        table = Table([Card(10), Card(20), Card(30), Card(40)])
+        table = fresh_table
         
         with pytest.raises(IndexError):
             table.get_row(-1)
         with pytest.raises(IndexError):
             table.get_row(4)
     
-    def test_find_target_row(self):
+    @pytest.mark.parametrize("candidate,expected_row", [
+        (C25, 1),  # Goes after 20 (smallest gap)
+        (C45, 3),  # Goes after 40
+        (C5, None),  # Can't be placed
+    ])
+    def test_find_target_row(self, fresh_table, candidate, expected_row):
         """Test finding best row for card placement."""
-        table = Table([Card(10), Card(20), Card(30), Card(40)])
-        
-        # Card 25 should go after 20 (smallest gap)
-        assert table.find_target_row(Card(25)) == 1
-        
-        # Card 45 should go after 40
-        assert table.find_target_row(Card(45)) == 3
-        
-        # Card 5 can't be placed
-        assert table.find_target_row(Card(5)) is None
+        assert fresh_table.find_target_row(candidate) == expected_row
     
-    def test_must_wipe_row(self):
+    def test_must_wipe_row(self, fresh_table):
         """Test checking if card forces row wipe."""
-        table = Table([Card(10), Card(20), Card(30), Card(40)])
+        table = fresh_table
         
-        assert table.must_wipe_row(Card(5))  # Lower than all
-        assert not table.must_wipe_row(Card(15))  # Can be placed
+        assert table.must_wipe_row(C5)  # Lower than all
+        assert not table.must_wipe_row(C15)  # Can be placed
     
-    def test_place_card_normal(self):
+    def test_place_card_normal(self, fresh_table):
         """Test normal card placement."""
-        table = Table([Card(10), Card(20), Card(30), Card(40)])
+        table = fresh_table
         
-        row_idx, wiped = table.place_card(Card(25))
+        row_idx, wiped = table.place_card(C25)
         
         assert row_idx == 1
         assert wiped is None
         assert table.get_row(1).card_count == 2
     
-    def test_place_card_forced_row(self):
+    def test_place_card_forced_row(self, fresh_table):
         """Test forced row placement (wipe)."""
-        table = Table([Card(10), Card(20), Card(30), Card(40)])
+        table = fresh_table
         
-        row_idx, wiped = table.place_card(Card(5), forced_row=2)
+        row_idx, wiped = table.place_card(C5, forced_row=2)
         
         assert row_idx == 2
-        assert len(wiped) == 1
-        assert wiped[0].value == 30
+        assert tuple(card.value for card in wiped) == (30,)
         assert table.get_row(2).last_card.value == 5
     
-    def test_place_card_causes_wipe(self):
+    def test_place_card_causes_wipe(self, fresh_table):
         """Test placing 5th card causes wipe."""
-        table = Table([Card(10), Card(20), Card(30), Card(40)])
+        table = fresh_table
         
         # Fill row 0 to 4 cards
-        table.place_card(Card(11))
-        table.place_card(Card(12))
-        table.place_card(Card(13))
+        table.place_card(C11)
+        table.place_card(C12)
+        table.place_card(C13)
         
         # 5th card should cause wipe
-        row_idx, wiped = table.place_card(Card(14))
+        row_idx, wiped = table.place_card(C14)
         
         assert row_idx == 0
-        assert len(wiped) == 4
+        assert tuple(card.value for card in wiped) == (10, 11, 12, 13)
         assert table.get_row(0).card_count == 1
         assert table.get_row(0).last_card.value == 14
     
-    def test_place_card_no_valid_row(self):
+    def test_place_card_no_valid_row(self, fresh_table):
         """Test placing card with no valid row."""
-        table = Table([Card(10), Card(20), Card(30), Card(40)])
+        table = fresh_table
         
         with pytest.raises(ValueError):
-            table.place_card(Card(5))  # No forced_row specified
+            table.place_card(C5)  # No forced_row specified
     
-    def test_get_row_choices(self):
+    def test_get_row_choices(self, fresh_table):
         """Test getting available row indices."""
-        table = Table([Card(10), Card(20), Card(30), Card(40)])
+        table = fresh_table
         
         choices = table.get_row_choices()
         assert choices == [0, 1, 2, 3]
     
-    def test_table_string_representation(self):
+    def test_table_iteration(self):
+        """Test iterating and indexing rows directly."""
+        cards = [C10, C20, C30, C40]
+        table = Table(cards)
+        
+        assert len(table) == 4
+        assert [row.last_card for row in table] == cards
+        assert table[2].last_card == cards[2]
+    
+    def test_min_last_value(self, fresh_table):
+        """Test lowest row end is tracked across placements."""
+        table = fresh_table
+        assert table.min_last_value == 10
+        
+        table.place_card(C11)
+        assert table.min_last_value == 11
+        
+        table.place_card(C5, forced_row=2)
+        assert table.min_last_value == 5
+    
+    def test_min_last_value_after_row_change(self, fresh_table):
+        """Test lowest row end reflects rows changed through get_row."""
+        table = fresh_table
+        
+        table.get_row(0).place_card(C15)
+        assert table.min_last_value == 15
+        
+        table.get_row(3).wipe_and_replace(C5)
+        assert table.min_last_value == 5
+    
+    def test_table_string_representation(self, fresh_table):
         """Test table string representation."""
-        table = Table([Card(10), Card(20), Card(30), Card(40)])
+        table = fresh_table
         
         output = str(table)
         assert "Row 1: [10]" in output